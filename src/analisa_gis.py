@@ -9,13 +9,42 @@ CATATAN: Data per provinsi adalah SIMULASI untuk tujuan edukasi.
 """
 
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 
 import utils
 import ui
 
+# Plotly >= 5.24: trace peta MapLibre (WebGL, tanpa token). Scattermapbox
+# (deprecated; yang dihapus adalah px.scatter_mapbox) hanya fallback untuk Plotly lama.
+_Scattermap = getattr(go, "Scattermap", None) or go.Scattermapbox
+_MAP_LAYOUT_KEY = "map" if hasattr(go, "Scattermap") else "mapbox"
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _build_hover(df_province: pd.DataFrame) -> pd.Series:
+    """Bangun hover text per provinsi (tidak bergantung pada metrik)."""
+    fmt = {
+        col: df_province[col].map(utils.format_number)
+        for col in ["Kasus", "Kematian", "Sembuh", "Aktif"]
+    }
+    return (
+        "<b>" + df_province["Provinsi"].astype(str) + "</b><br>"
+        + "Kasus: " + fmt["Kasus"] + "<br>"
+        + "Kematian: " + fmt["Kematian"] + "<br>"
+        + "Sembuh: " + fmt["Sembuh"] + "<br>"
+        + "Aktif: " + fmt["Aktif"] + "<br>"
+        + "Kasus/100K: " + df_province["Kasus_per_100K"].astype(str)
+    )
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _compute_sizes(df_province: pd.DataFrame, metric: str) -> pd.Series:
+    """Ukuran marker peta berdasarkan metrik yang dipilih."""
+    size_col = metric if metric in df_province.columns else "Kasus"
+    max_val = df_province[size_col].max()
+    return (df_province[size_col] / max_val * 50).clip(lower=10)
+
 
 def tampilkan_analisa_gis(df_province: pd.DataFrame):
     """Tampilkan halaman analisis GIS."""
@@ -36,6 +65,13 @@ def tampilkan_analisa_gis(df_province: pd.DataFrame):
     
     st.divider()
     
+    _gis_interactive(df_province)
+
+
+@ui.fragment
+def _gis_interactive(df_province: pd.DataFrame):
+    """Kontrol, peta, ranking, dan bar chart (rerun hanya bagian ini)."""
+    
     # --- Controls ---
     col1, col2 = st.columns([0.7, 0.3])
     
@@ -70,52 +106,41 @@ def tampilkan_analisa_gis(df_province: pd.DataFrame):
     # --- Map ---
     st.subheader("Peta Sebaran COVID-19")
     
-    # Prepare hover text
-    df_province["hover_text"] = df_province.apply(
-        lambda row: (
-            f"<b>{row['Provinsi']}</b><br>"
-            f"Kasus: {utils.format_number(row['Kasus'])}<br>"
-            f"Kematian: {utils.format_number(row['Kematian'])}<br>"
-            f"Sembuh: {utils.format_number(row['Sembuh'])}<br>"
-            f"Aktif: {utils.format_number(row['Aktif'])}<br>"
-            f"Kasus/100K: {row['Kasus_per_100K']}"
-        ),
-        axis=1
-    )
-    
-    # Size based on metric
-    size_col = metric if metric in df_province.columns else "Kasus"
-    max_val = df_province[size_col].max()
-    df_province["size"] = (df_province[size_col] / max_val * 50).clip(lower=10)
+    # Hover text & ukuran marker (cache: tidak dibangun ulang tiap rerun)
+    hover_text = _build_hover(df_province)
+    sizes = _compute_sizes(df_province, metric)
     
     # Color scale
     color_scale = "Reds" if metric in ["Kematian", "Aktif"] else "Purples"
     
-    fig = px.scatter_mapbox(
-        df_province,
-        lat="lat",
-        lon="lon",
-        size="size",
-        color=metric,
-        hover_name="Provinsi",
-        hover_data={
-            "Kasus": True,
-            "Kematian": True,
-            "Sembuh": True,
-            "Aktif": True,
-            "Kasus_per_100K": True,
-            "lat": False,
-            "lon": False,
-            "size": False,
-        },
-        color_continuous_scale=color_scale,
-        zoom=4,
-        center={"lat": -2.5, "lon": 118},
-        mapbox_style=basemap_style,
-        title=f"Sebaran {metric.replace('_', ' ')} per Provinsi",
-    )
+    metric_label = metric.replace('_', ' ')
+    values = df_province[metric].to_numpy()
+    size_arr = sizes.to_numpy()
+    
+    fig = go.Figure(_Scattermap(
+        lat=df_province["lat"].to_numpy(),
+        lon=df_province["lon"].to_numpy(),
+        mode="markers",
+        marker=dict(
+            size=size_arr,
+            sizemode="area",
+            sizeref=2.0 * size_arr.max() / (20 ** 2),
+            color=values,
+            colorscale=color_scale,
+            showscale=True,
+            colorbar=dict(title=metric_label),
+        ),
+        hovertext=hover_text.to_numpy(),
+        hoverinfo="text",
+    ))
     
     fig.update_layout(
+        title=f"Sebaran {metric_label} per Provinsi",
+        **{_MAP_LAYOUT_KEY: dict(
+            style=basemap_style,
+            zoom=4,
+            center={"lat": -2.5, "lon": 118},
+        )},
         margin=dict(l=0, r=0, t=40, b=0),
         height=600,
     )
@@ -127,17 +152,17 @@ def tampilkan_analisa_gis(df_province: pd.DataFrame):
     # --- Ranking Table ---
     st.subheader("Ranking Provinsi")
     
-    # Sort by selected metric
-    df_sorted = df_province.sort_values(metric, ascending=False).reset_index(drop=True)
-    df_sorted.index = df_sorted.index + 1  # 1-indexed ranking
+    # Top-N berdasarkan metrik (tanpa sort seluruh DataFrame)
+    df_top15 = df_province.nlargest(15, metric).reset_index(drop=True)
     
     # Display top 10
     display_cols = ["Provinsi", "Kasus", "Kematian", "Sembuh", "Aktif", "Kasus_per_100K"]
-    df_display = df_sorted[display_cols].head(10)
+    df_display = df_top15[display_cols].head(10).copy()
+    df_display.index = df_display.index + 1  # 1-indexed ranking
     
     # Format numbers
-    for col in ["Kasus", "Kematian", "Sembuh", "Aktif"]:
-        df_display[col] = df_display[col].apply(utils.format_number)
+    num_cols = ["Kasus", "Kematian", "Sembuh", "Aktif"]
+    df_display[num_cols] = df_display[num_cols].apply(utils.format_number_series)
     
     st.dataframe(df_display, use_container_width=True)
     
@@ -148,16 +173,23 @@ def tampilkan_analisa_gis(df_province: pd.DataFrame):
     # --- Bar Chart Comparison ---
     st.subheader("Perbandingan Antar Provinsi")
     
-    fig_bar = px.bar(
-        df_sorted.head(15),
-        x="Provinsi",
-        y=metric,
-        title=f"Top 15 Provinsi berdasarkan {metric.replace('_', ' ')}",
-        color=metric,
-        color_continuous_scale=color_scale,
-    )
+    top_values = df_top15[metric].to_numpy()
+    
+    fig_bar = go.Figure(go.Bar(
+        x=df_top15["Provinsi"].astype(str).to_numpy(),
+        y=top_values,
+        marker=dict(
+            color=top_values,
+            colorscale=color_scale,
+            showscale=True,
+            colorbar=dict(title=metric_label),
+        ),
+    ))
     
     fig_bar.update_layout(
+        title=f"Top 15 Provinsi berdasarkan {metric_label}",
+        xaxis_title="Provinsi",
+        yaxis_title=metric_label,
         xaxis_tickangle=-45,
         margin=dict(l=0, r=0, t=40, b=0),
         showlegend=False,
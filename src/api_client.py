@@ -9,28 +9,75 @@ Tujuan file ini:
 from __future__ import annotations
 
 import os
+import functools
 from typing import Optional
 from datetime import datetime
 
 import requests
+import numpy as np
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def _get_config_value(key: str, default: str = "") -> str:
-    """Ambil konfigurasi dari environment variable."""
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except Exception:
-        pass
-    
-    value = os.getenv(key)
-    return str(value).strip() if value else default
+try:
+    import streamlit as st
+    _cache_resource = st.cache_resource
+except Exception:
+    # Modul ini juga bisa dipakai di luar Streamlit (script/notebook)
+    _cache_resource = functools.lru_cache(maxsize=None)
+
+# Konfigurasi dari environment (.env dibaca sekali saat import)
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except Exception:
+    pass
+
+_BASE_URL = (os.getenv("COVID_API_BASE_URL") or "").strip() or "https://disease.sh/v3/covid-19"
+
+
+# Kolom hitungan data historis; total Indonesia muat di int32 (< 2,1 miliar)
+_HISTORICAL_DTYPES = {
+    "Tanggal": "datetime64[ns]",
+    "Kasus": "int32",
+    "Kematian": "int32",
+    "Sembuh": "int32",
+    "Kasus_Baru": "int32",
+    "Kematian_Baru": "int32",
+    "Sembuh_Baru": "int32",
+}
+
+# Total dosis bisa melebihi 2^31, dosis harian tidak
+_VACCINE_DTYPES = {
+    "Tanggal": "datetime64[ns]",
+    "Total_Vaksin": "int64",
+    "Dosis_Harian": "int32",
+}
 
 
-def _get_base_url() -> str:
-    """Get API base URL."""
-    return _get_config_value("COVID_API_BASE_URL", "https://disease.sh/v3/covid-19")
+@_cache_resource
+def _http_session() -> requests.Session:
+    """Session HTTP bersama (keep-alive + retry) untuk semua request API."""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_json(url: str, timeout: int) -> dict:
+    """GET url lalu decode JSON (pakai orjson jika terpasang)."""
+    response = _http_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 def fetch_indonesia_current() -> Optional[dict]:
@@ -41,10 +88,8 @@ def fetch_indonesia_current() -> Optional[dict]:
         dict dengan keys: cases, deaths, recovered, active, critical, dll.
     """
     try:
-        url = f"{_get_base_url()}/countries/indonesia"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        url = f"{_BASE_URL}/countries/indonesia"
+        return _get_json(url, timeout=10)
     except Exception as e:
         print(f"Error fetching current data: {e}")
         return None
@@ -61,10 +106,8 @@ def fetch_indonesia_historical(last_days: str = "all") -> Optional[dict]:
         dict dengan timeline cases, deaths, recovered
     """
     try:
-        url = f"{_get_base_url()}/historical/indonesia?lastdays={last_days}"
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        return response.json()
+        url = f"{_BASE_URL}/historical/indonesia?lastdays={last_days}"
+        return _get_json(url, timeout=15)
     except Exception as e:
         print(f"Error fetching historical data: {e}")
         return None
@@ -78,15 +121,20 @@ def fetch_vaccine_data() -> Optional[dict]:
         dict dengan data vaksinasi atau None jika tidak tersedia
     """
     try:
-        url = f"{_get_base_url()}/vaccine/coverage/countries/indonesia?lastdays=all"
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        url = f"{_BASE_URL}/vaccine/coverage/countries/indonesia?lastdays=all"
+        return _get_json(url, timeout=10)
     except Exception as e:
         print(f"Error fetching vaccine data: {e}")
         return None
 
 
+def _daily_delta(cumulative: np.ndarray) -> np.ndarray:
+    """Selisih harian dari data kumulatif (hari pertama 0, negatif di-clip ke 0)."""
+    delta = np.diff(cumulative, prepend=cumulative[:1])
+    np.maximum(delta, 0, out=delta)
+    return delta.astype(np.int32, copy=False)
+
+
 def get_historical_df() -> pd.DataFrame:
     """
     Fetch dan konversi data historis ke DataFrame.
@@ -101,47 +149,50 @@ def get_historical_df() -> pd.DataFrame:
     
     timeline = data["timeline"]
     
-    # Parse timeline
-    rows = []
-    dates = list(timeline.get("cases", {}).keys())
+    # Parse timeline (format tanggal: "1/22/20")
+    cases_d = timeline.get("cases", {})
+    deaths_d = timeline.get("deaths", {})
+    recovered_d = timeline.get("recovered", {})
+    dates = list(cases_d.keys())
     
-    for date_str in dates:
-        try:
-            # Format: "1/22/20" -> datetime
-            dt = datetime.strptime(date_str, "%m/%d/%y")
-            cases = timeline.get("cases", {}).get(date_str, 0)
-            deaths = timeline.get("deaths", {}).get(date_str, 0)
-            recovered = timeline.get("recovered", {}).get(date_str, 0)
-            
-            rows.append({
-                "Tanggal": dt,
-                "Kasus": cases,
-                "Kematian": deaths,
-                "Sembuh": recovered,
-            })
-        except Exception:
-            continue
+    df = pd.DataFrame({
+        "Tanggal": pd.to_datetime(dates, format="%m/%d/%y", errors="coerce"),
+        "Kasus": list(cases_d.values()),
+        "Kematian": [deaths_d.get(d, 0) for d in dates],
+        "Sembuh": [recovered_d.get(d, 0) for d in dates],
+    })
+    df = df.dropna(subset=["Tanggal"])
     
-    if not rows:
+    if df.empty:
         return _get_sample_historical_df()
     
-    df = pd.DataFrame(rows)
     df = df.sort_values("Tanggal").reset_index(drop=True)
     
+    # Nilai null/non-angka dari API: pakai total kumulatif hari sebelumnya
+    # (bukan 0, agar delta harian tidak melonjak); tanpa data sebelumnya -> 0
+    count_cols = ["Kasus", "Kematian", "Sembuh"]
+    df[count_cols] = df[count_cols].apply(pd.to_numeric, errors="coerce").ffill().fillna(0)
+    
     # Hitung daily new cases (delta dari hari sebelumnya)
-    df["Kasus_Baru"] = df["Kasus"].diff().fillna(0).clip(lower=0).astype(int)
-    df["Kematian_Baru"] = df["Kematian"].diff().fillna(0).clip(lower=0).astype(int)
-    df["Sembuh_Baru"] = df["Sembuh"].diff().fillna(0).clip(lower=0).astype(int)
+    df["Kasus_Baru"] = _daily_delta(df["Kasus"].to_numpy())
+    df["Kematian_Baru"] = _daily_delta(df["Kematian"].to_numpy())
+    df["Sembuh_Baru"] = _daily_delta(df["Sembuh"].to_numpy())
     
-    return df
+    return df.astype(_HISTORICAL_DTYPES)
 
 
 def _get_sample_historical_df() -> pd.DataFrame:
     """
     Fallback: DataFrame sample jika API gagal.
     """
-    import numpy as np
-    
+    # Salinan: frame yang di-cache tidak boleh ikut termodifikasi pemanggil
+    return _build_sample_historical_df().copy()
+
+
+# Sample fallback bersifat deterministik (seed 42), cukup di-generate sekali per proses
+@functools.lru_cache(maxsize=1)
+def _build_sample_historical_df() -> pd.DataFrame:
+    """Generate DataFrame sample historis (365 hari)."""
     # Generate sample data untuk 365 hari
     dates = pd.date_range(start="2020-03-01", periods=365, freq="D")
     
@@ -167,7 +218,7 @@ def _get_sample_historical_df() -> pd.DataFrame:
         "Sembuh_Baru": (daily_cases * 0.85).astype(int),
     })
     
-    return df
+    return df.astype(_HISTORICAL_DTYPES)
 
 
 # Data koordinat provinsi Indonesia
@@ -247,6 +298,21 @@ PROVINSI_POPULASI = {
 }
 
 
+# Data provinsi dalam bentuk kolom (dibangun sekali saat import)
+_PROV_DF = pd.DataFrame({
+    "Provinsi": list(PROVINSI_POPULASI.keys()),
+    "Populasi_juta": np.fromiter(PROVINSI_POPULASI.values(), dtype=np.float64),
+    "lat": np.fromiter(
+        (PROVINSI_COORDS.get(p, {"lat": 0})["lat"] for p in PROVINSI_POPULASI),
+        dtype=np.float64,
+    ),
+    "lon": np.fromiter(
+        (PROVINSI_COORDS.get(p, {"lon": 0})["lon"] for p in PROVINSI_POPULASI),
+        dtype=np.float64,
+    ),
+})
+
+
 def generate_province_simulation(total_cases: int = 6800000) -> pd.DataFrame:
     """
     Generate data simulasi COVID-19 per provinsi.
@@ -260,46 +326,36 @@ def generate_province_simulation(total_cases: int = 6800000) -> pd.DataFrame:
     Returns:
         DataFrame dengan kolom: Provinsi, Kasus, Kematian, Sembuh, Aktif, lat, lon
     """
-    import numpy as np
-    np.random.seed(42)
-    
-    rows = []
-    
-    # Distribusi berdasarkan populasi dengan noise
-    total_pop = sum(PROVINSI_POPULASI.values())
-    
-    for prov, pop in PROVINSI_POPULASI.items():
-        # Proporsi berdasarkan populasi + random noise
-        base_ratio = pop / total_pop
-        noise = np.random.uniform(0.5, 1.5)
-        
-        # DKI Jakarta dan Jawa cenderung lebih tinggi
-        if "Jakarta" in prov or "Jawa" in prov:
-            noise *= 1.3
-        
-        kasus = int(total_cases * base_ratio * noise)
-        kematian = int(kasus * np.random.uniform(0.015, 0.030))
-        sembuh = int(kasus * np.random.uniform(0.90, 0.98))
-        aktif = max(0, kasus - kematian - sembuh)
-        
-        coords = PROVINSI_COORDS.get(prov, {"lat": 0, "lon": 0})
-        
-        rows.append({
-            "Provinsi": prov,
-            "Kasus": kasus,
-            "Kematian": kematian,
-            "Sembuh": sembuh,
-            "Aktif": aktif,
-            "Populasi": pop * 1_000_000,
-            "Kasus_per_100K": round(kasus / (pop * 10), 2),
-            "lat": coords["lat"],
-            "lon": coords["lon"],
-        })
-    
-    df = pd.DataFrame(rows)
-    df = df.sort_values("Kasus", ascending=False).reset_index(drop=True)
-    
-    return df
+    pops = _PROV_DF["Populasi_juta"].to_numpy()
+    n = len(pops)
+    rng = np.random.default_rng(42)
+    
+    # Proporsi berdasarkan populasi + random noise
+    base_ratio = pops / pops.sum()
+    noise = rng.uniform(0.5, 1.5, size=n)
+    
+    # DKI Jakarta dan Jawa cenderung lebih tinggi
+    noise *= np.where(_PROV_DF["Provinsi"].str.contains("Jakarta|Jawa"), 1.3, 1.0)
+    
+    kasus = (total_cases * base_ratio * noise).astype(int)
+    kematian = (kasus * rng.uniform(0.015, 0.030, size=n)).astype(int)
+    sembuh = (kasus * rng.uniform(0.90, 0.98, size=n)).astype(int)
+    aktif = np.maximum(kasus - kematian - sembuh, 0)
+    
+    # Urutkan sekali berdasarkan kasus, lalu bangun DataFrame final
+    order = np.argsort(-kasus, kind="stable")
+    
+    return pd.DataFrame({
+        "Provinsi": pd.Categorical(_PROV_DF["Provinsi"].to_numpy()[order]),
+        "Kasus": kasus[order],
+        "Kematian": kematian[order],
+        "Sembuh": sembuh[order],
+        "Aktif": aktif[order],
+        "Populasi": pops[order] * 1_000_000,
+        "Kasus_per_100K": np.round(kasus[order] / (pops[order] * 10), 2),
+        "lat": _PROV_DF["lat"].to_numpy()[order],
+        "lon": _PROV_DF["lon"].to_numpy()[order],
+    })
 
 
 def get_current_stats() -> dict:
@@ -370,16 +426,23 @@ def get_vaccine_df() -> pd.DataFrame:
     
     df = pd.DataFrame(rows)
     df = df.sort_values("Tanggal").reset_index(drop=True)
+    # Total kumulatif yang null mengikuti hari sebelumnya; dosis harian null -> 0
+    df["Total_Vaksin"] = pd.to_numeric(df["Total_Vaksin"], errors="coerce").ffill()
+    df = df.fillna({"Total_Vaksin": 0, "Dosis_Harian": 0})
     
-    return df
+    return df.astype(_VACCINE_DTYPES)
 
 
 def _get_sample_vaccine_df() -> pd.DataFrame:
     """
     Fallback: DataFrame sample vaksinasi.
     """
-    import numpy as np
-    
+    return _build_sample_vaccine_df().copy()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_sample_vaccine_df() -> pd.DataFrame:
+    """Generate DataFrame sample vaksinasi (730 hari)."""
     dates = pd.date_range(start="2021-01-13", periods=730, freq="D")
     
     np.random.seed(42)
@@ -400,4 +463,4 @@ def _get_sample_vaccine_df() -> pd.DataFrame:
         "Dosis_Harian": daily,
     })
     
-    return df
+    return df.astype(_VACCINE_DTYPES)
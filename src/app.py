@@ -8,6 +8,8 @@ Data diambil dari disease.sh API.
 import streamlit as st
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
@@ -19,6 +21,11 @@ try:
 except Exception:
     pass
 
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+except Exception:
+    add_script_run_ctx = get_script_run_ctx = None
+
 # Add src directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -64,6 +71,38 @@ def _load_province_cached():
     return api_client.generate_province_simulation(total_cases)
 
 
+def _with_script_ctx(fn):
+    """Bungkus fn agar thread worker membawa ScriptRunContext Streamlit."""
+    ctx = get_script_run_ctx() if get_script_run_ctx else None
+
+    def _run():
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return fn()
+
+    return _run
+
+
+@st.cache_resource(show_spinner=False)
+def _loader_pool() -> ThreadPoolExecutor:
+    """Thread pool loader data, dibuat sekali per proses (bukan per rerun)."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="covid-loader")
+
+
+def _load_all_data():
+    """Muat data historis, current, dan provinsi (historis paralel saat cold start)."""
+    if add_script_run_ctx is None:
+        # Fallback berurutan: worker tanpa ScriptRunContext tidak aman untuk cache Streamlit
+        return _load_historical_cached(), _load_current_cached(), _load_province_cached()
+
+    # Historis (fetch terbesar) di worker; current + provinsi di thread utama,
+    # karena data provinsi butuh total kasus dari data current
+    f_hist = _loader_pool().submit(_with_script_ctx(_load_historical_cached))
+    current_stats = _load_current_cached()
+    df_province = _load_province_cached()
+    return f_hist.result(), current_stats, df_province
+
+
 def main():
     """
     Fungsi utama aplikasi Streamlit
@@ -153,9 +192,7 @@ def main():
 
     # Load data dengan spinner
     with st.spinner("Memuat data COVID-19..."):
-        df_historical = _load_historical_cached()
-        current_stats = _load_current_cached()
-        df_province = _load_province_cached()
+        df_historical, current_stats, df_province = _load_all_data()
 
     # Routing ke halaman yang sesuai
     if halaman == "Dashboard Utama":
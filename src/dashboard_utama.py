@@ -16,6 +16,44 @@ import utils
 import ui
 
 
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _trend_fig(df_historical: pd.DataFrame) -> dict:
+    """Figure kasus baru 30 hari terakhir + rata-rata 7 hari (sebagai dict)."""
+    df_recent = df_historical.tail(30)
+    tanggal = df_recent["Tanggal"].to_numpy()
+    kasus_baru = df_recent["Kasus_Baru"]
+    
+    # Chart kasus baru harian
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=tanggal,
+        y=kasus_baru.to_numpy(),
+        name="Kasus Baru",
+        marker_color="rgba(124, 58, 237, 0.7)",
+    ))
+    
+    # Rolling average
+    fig.add_trace(go.Scatter(
+        x=tanggal,
+        y=kasus_baru.rolling(window=7, min_periods=1).mean().to_numpy(),
+        name="Rata-rata 7 Hari",
+        line=dict(color="rgba(220, 38, 38, 0.9)", width=2),
+    ))
+    
+    fig.update_layout(
+        title="Kasus Baru Harian",
+        xaxis_title="Tanggal",
+        yaxis_title="Jumlah Kasus",
+        hovermode="x unified",
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    
+    return fig.to_dict()
+
+
 def tampilkan_dashboard_utama(current_stats: dict, df_historical: pd.DataFrame):
     """Tampilkan dashboard utama COVID-19."""
     
@@ -112,37 +150,7 @@ def tampilkan_dashboard_utama(current_stats: dict, df_historical: pd.DataFrame):
     st.subheader("Trend 30 Hari Terakhir")
     
     if not df_historical.empty and len(df_historical) >= 30:
-        df_recent = df_historical.tail(30).copy()
-        
-        # Chart kasus baru harian
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            x=df_recent["Tanggal"],
-            y=df_recent["Kasus_Baru"],
-            name="Kasus Baru",
-            marker_color="rgba(124, 58, 237, 0.7)",
-        ))
-        
-        # Rolling average
-        df_recent["Rolling_7"] = df_recent["Kasus_Baru"].rolling(window=7, min_periods=1).mean()
-        
-        fig.add_trace(go.Scatter(
-            x=df_recent["Tanggal"],
-            y=df_recent["Rolling_7"],
-            name="Rata-rata 7 Hari",
-            line=dict(color="rgba(220, 38, 38, 0.9)", width=2),
-        ))
-        
-        fig.update_layout(
-            title="Kasus Baru Harian",
-            xaxis_title="Tanggal",
-            yaxis_title="Jumlah Kasus",
-            hovermode="x unified",
-            showlegend=True,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            margin=dict(l=0, r=0, t=40, b=0),
-        )
+        fig = go.Figure(_trend_fig(df_historical))
         
         st.plotly_chart(fig, **ui.kw_plotly_chart())
     else:
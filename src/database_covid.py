@@ -6,14 +6,98 @@ Menampilkan tabel data lengkap dengan:
 - Pagination untuk dataset besar
 """
 
+import io
+
+import numpy as np
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
 import utils
 import ui
 
 
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _unique_years(df: pd.DataFrame) -> list[int]:
+    """Daftar tahun unik (terurut) dari kolom Tanggal."""
+    years = df["Tanggal"].to_numpy().astype("datetime64[Y]").astype(int) + 1970
+    return np.unique(years).tolist()
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _filter_data(df: pd.DataFrame, start_date, end_date, selected_year: int | None) -> pd.DataFrame:
+    """Terapkan filter tanggal + tahun (cache per kombinasi filter)."""
+    df_filtered = utils.filter_by_date_range(df, start_date, end_date)
+    
+    if selected_year is not None:
+        # Range [1 Jan, 1 Jan tahun berikutnya) langsung pada buffer datetime64
+        # (tanpa membentuk Series .dt.year)
+        lo = pd.Timestamp(selected_year, 1, 1).to_datetime64()
+        hi = pd.Timestamp(selected_year + 1, 1, 1).to_datetime64()
+        tanggal = df_filtered["Tanggal"].to_numpy()
+        df_filtered = df_filtered.iloc[(tanggal >= lo) & (tanggal < hi)]
+    
+    return df_filtered
+
+
+# Kolom tabel/export -> label tampilan
+_DISPLAY_COLUMNS = {
+    "Tanggal": "Tanggal",
+    "Kasus": "Kasus Kumulatif",
+    "Kematian": "Kematian Kumulatif",
+    "Sembuh": "Sembuh Kumulatif",
+    "Kasus_Baru": "Kasus Baru",
+    "Kematian_Baru": "Kematian Baru",
+}
+
+# Format tampilan tabel (Tanggal tetap datetime, diformat di frontend)
+_DISPLAY_COLUMN_CONFIG = {
+    "Tanggal": st.column_config.DateColumn("Tanggal", format="DD/MM/YYYY"),
+    **{
+        label: st.column_config.NumberColumn(label, format="%d")
+        for col, label in _DISPLAY_COLUMNS.items()
+        if col != "Tanggal"
+    },
+}
+
+
+def _display_view(df_filtered: pd.DataFrame) -> pd.DataFrame:
+    """Pilih & rename kolom untuk tampilan (tanpa format string tanggal)."""
+    return df_filtered[list(_DISPLAY_COLUMNS)].rename(columns=_DISPLAY_COLUMNS)
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _build_csv_bytes(df_filtered: pd.DataFrame) -> bytes:
+    """Encode data export ke CSV (bytes) sekali per filter."""
+    # Tulis langsung ke buffer biner: tanpa string CSV perantara + encode ulang
+    buf = io.BytesIO()
+    _display_view(df_filtered).to_csv(buf, index=False, date_format="%d/%m/%Y", encoding="utf-8")
+    return buf.getvalue()
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _quick_stats(df_filtered: pd.DataFrame) -> dict:
+    """Agregasi untuk metric cards periode terpilih."""
+    # Rentang tanggal langsung dari buffer datetime64 (reduksi numpy)
+    tanggal = df_filtered["Tanggal"].to_numpy()
+    
+    # Satu pass .agg untuk semua reduksi
+    agg = df_filtered.agg({
+        "Kasus_Baru": ["sum", "mean", "max"],
+        "Kematian_Baru": ["sum", "mean"],
+    })
+    date_min = pd.Timestamp(tanggal.min())
+    date_max = pd.Timestamp(tanggal.max())
+    return {
+        "range_label": f"{date_min:%d/%m/%Y} - {date_max:%d/%m/%Y}",
+        "total_kasus": agg.at["sum", "Kasus_Baru"],
+        "mean_kasus": agg.at["mean", "Kasus_Baru"],
+        "max_kasus": agg.at["max", "Kasus_Baru"],
+        "mean_kematian": agg.at["mean", "Kematian_Baru"],
+        "total_kematian": agg.at["sum", "Kematian_Baru"],
+    }
+
+
 def tampilkan_database_covid(df: pd.DataFrame):
     """Tampilkan halaman database COVID-19."""
     
@@ -54,24 +138,23 @@ def tampilkan_database_covid(df: pd.DataFrame):
     
     with col3:
         # Filter by year
-        years = sorted(df["Tanggal"].dt.year.unique())
+        years = _unique_years(df)
         selected_year = st.selectbox(
             "Tahun (opsional)",
-            options=["Semua"] + [str(y) for y in years],
+            options=[None, *years],
+            format_func=lambda y: "Semua" if y is None else str(y),
             key="db_year"
         )
     
     # Apply filters
-    df_filtered = utils.filter_by_date_range(df, start_date, end_date)
-    
-    if selected_year != "Semua":
-        df_filtered = df_filtered[df_filtered["Tanggal"].dt.year == int(selected_year)]
+    df_filtered = _filter_data(df, start_date, end_date, selected_year)
+    stats = _quick_stats(df_filtered) if not df_filtered.empty else {}
     
     # Active filters display
     active_filters = {
         "Mulai": start_date.strftime("%d/%m/%Y") if start_date != min_date else None,
         "Akhir": end_date.strftime("%d/%m/%Y") if end_date != max_date else None,
-        "Tahun": selected_year if selected_year != "Semua" else None,
+        "Tahun": str(selected_year) if selected_year is not None else None,
     }
     
     ui.active_filters_bar(
@@ -90,16 +173,13 @@ def tampilkan_database_covid(df: pd.DataFrame):
     
     with col2:
         if not df_filtered.empty:
-            st.metric(
-                "Rentang Tanggal",
-                f"{df_filtered['Tanggal'].min().strftime('%d/%m/%Y')} - {df_filtered['Tanggal'].max().strftime('%d/%m/%Y')}"
-            )
+            st.metric("Rentang Tanggal", stats["range_label"])
     
     with col3:
         if not df_filtered.empty:
             st.metric(
                 "Total Kasus (periode)",
-                utils.format_number(df_filtered["Kasus_Baru"].sum())
+                utils.format_number(stats["total_kasus"])
             )
     
     st.divider()
@@ -111,20 +191,10 @@ def tampilkan_database_covid(df: pd.DataFrame):
         st.info("Tidak ada data untuk filter yang dipilih.")
         return
     
-    # Prepare display dataframe
-    df_display = df_filtered.copy()
-    df_display["Tanggal"] = df_display["Tanggal"].dt.strftime("%d/%m/%Y")
-    
-    # Reorder columns
-    display_cols = ["Tanggal", "Kasus", "Kematian", "Sembuh", "Kasus_Baru", "Kematian_Baru"]
-    df_display = df_display[display_cols]
-    
-    # Rename for display
-    df_display.columns = ["Tanggal", "Kasus Kumulatif", "Kematian Kumulatif", "Sembuh Kumulatif", "Kasus Baru", "Kematian Baru"]
-    
     # Show dataframe
     st.dataframe(
-        df_display,
+        _display_view(df_filtered),
+        column_config=_DISPLAY_COLUMN_CONFIG,
         use_container_width=True,
         hide_index=True,
         height=500,
@@ -139,18 +209,18 @@ def tampilkan_database_covid(df: pd.DataFrame):
     
     with col1:
         # CSV Export
-        csv = df_display.to_csv(index=False)
+        csv = _build_csv_bytes(df_filtered)
         st.download_button(
             label="Download CSV",
             data=csv,
-            file_name=f"covid19_indonesia_{datetime.now().strftime('%Y%m%d')}.csv",
+            file_name=f"covid19_indonesia_{date.today():%Y%m%d}.csv",
             mime="text/csv",
             key="download_csv"
         )
     
     with col2:
         st.caption(
-            f"Export {len(df_display):,} baris data. "
+            f"Export {len(df_filtered):,} baris data. "
             f"File akan berisi data sesuai filter yang dipilih."
         )
     
@@ -164,23 +234,23 @@ def tampilkan_database_covid(df: pd.DataFrame):
     with col1:
         st.metric(
             "Rata-rata Kasus/Hari",
-            utils.format_number(df_filtered["Kasus_Baru"].mean())
+            utils.format_number(stats["mean_kasus"])
         )
     
     with col2:
         st.metric(
             "Maks Kasus/Hari",
-            utils.format_number(df_filtered["Kasus_Baru"].max())
+            utils.format_number(stats["max_kasus"])
         )
     
     with col3:
         st.metric(
             "Rata-rata Kematian/Hari",
-            utils.format_number(df_filtered["Kematian_Baru"].mean())
+            utils.format_number(stats["mean_kematian"])
         )
     
     with col4:
         st.metric(
             "Total Kematian (periode)",
-            utils.format_number(df_filtered["Kematian_Baru"].sum())
+            utils.format_number(stats["total_kematian"])
         )
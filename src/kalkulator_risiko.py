@@ -6,12 +6,65 @@ Menyediakan kalkulator interaktif untuk:
 - Herd Immunity Threshold
 """
 
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
 
 import utils
 import ui
 
+# Konstanta gauge (CFR & herd immunity): dipakai ulang, tidak dibangun per rerun
+_GAUGE_BAR = {'color': "rgba(124, 58, 237, 0.8)"}
+_GAUGE_LAYOUT = dict(height=300, margin=dict(l=0, r=0, t=40, b=0))
+
+_CFR_GAUGE_STEPS = (
+    {'range': [0, 1], 'color': "rgba(34, 197, 94, 0.3)"},
+    {'range': [1, 3], 'color': "rgba(234, 179, 8, 0.3)"},
+    {'range': [3, 10], 'color': "rgba(220, 38, 38, 0.3)"},
+)
+
+_HERD_GAUGE_STEPS = (
+    {'range': [0, 50], 'color': "rgba(34, 197, 94, 0.3)"},
+    {'range': [50, 80], 'color': "rgba(234, 179, 8, 0.3)"},
+    {'range': [80, 100], 'color': "rgba(220, 38, 38, 0.3)"},
+)
+
+
+@st.cache_data(ttl=60 * 60, max_entries=256, show_spinner=False)
+def _cfr_gauge(cfr: float) -> dict:
+    """Gauge CFR (sebagai dict)."""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=cfr,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "CFR (%)"},
+        gauge={
+            'axis': {'range': [0, 10]},
+            'bar': _GAUGE_BAR,
+            'steps': _CFR_GAUGE_STEPS,
+        },
+    ))
+    fig.update_layout(**_GAUGE_LAYOUT)
+    return fig.to_dict()
+
+
+@st.cache_data(ttl=60 * 60, max_entries=256, show_spinner=False)
+def _herd_gauge(herd_threshold: float) -> dict:
+    """Gauge herd immunity threshold (sebagai dict)."""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=herd_threshold,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Herd Immunity Threshold (%)"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': _GAUGE_BAR,
+            'steps': _HERD_GAUGE_STEPS,
+        },
+    ))
+    fig.update_layout(**_GAUGE_LAYOUT)
+    return fig.to_dict()
+
 
 def tampilkan_kalkulator_risiko(current_stats: dict):
     """Tampilkan halaman kalkulator risiko."""
@@ -40,6 +93,7 @@ def tampilkan_kalkulator_risiko(current_stats: dict):
         _show_projection_calculator()
 
 
+@ui.fragment
 def _show_cfr_calculator(current_stats: dict):
     """Tampilkan kalkulator CFR."""
     
@@ -95,23 +149,8 @@ def _show_cfr_calculator(current_stats: dict):
             else:
                 st.error("CFR tinggi (> 3%): Angka kematian signifikan.")
             
-            # Gauge chart
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=cfr,
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "CFR (%)"},
-                gauge={
-                    'axis': {'range': [0, 10]},
-                    'bar': {'color': "rgba(124, 58, 237, 0.8)"},
-                    'steps': [
-                        {'range': [0, 1], 'color': "rgba(34, 197, 94, 0.3)"},
-                        {'range': [1, 3], 'color': "rgba(234, 179, 8, 0.3)"},
-                        {'range': [3, 10], 'color': "rgba(220, 38, 38, 0.3)"},
-                    ],
-                },
-            ))
-            fig.update_layout(height=300, margin=dict(l=0, r=0, t=40, b=0))
+            # Gauge chart (cache per nilai yang dibulatkan)
+            fig = go.Figure(_cfr_gauge(round(cfr, 2)))
             st.plotly_chart(fig, **ui.kw_plotly_chart())
     
     st.divider()
@@ -127,6 +166,7 @@ def _show_cfr_calculator(current_stats: dict):
     st.info(f"CFR Indonesia saat ini: **{utils.format_percentage(actual_cfr)}**")
 
 
+@ui.fragment
 def _show_r0_calculator():
     """Tampilkan kalkulator R0 dan Herd Immunity."""
     
@@ -143,7 +183,7 @@ def _show_r0_calculator():
     """)
     
     # Handle preset buttons BEFORE slider to avoid session_state conflict
-    # Check if any preset was clicked (we use a temporary key)
+    # (nilai preset ditulis sebelum slider dibuat -> tanpa st.rerun)
     if "r0_input" not in st.session_state:
         st.session_state["r0_input"] = 2.5
     
@@ -152,21 +192,18 @@ def _show_r0_calculator():
     with col1:
         st.markdown("### Input R0")
         
-        # Quick presets - rendered before slider, but we handle clicks via callback
+        # Quick presets - rendered before slider
         st.markdown("**Preset Varian:**")
         col_a, col_b, col_c = st.columns(3)
         with col_a:
             if st.button("Asli (2.5)", key="preset_original"):
                 st.session_state["r0_input"] = 2.5
-                st.rerun()
         with col_b:
             if st.button("Delta (6)", key="preset_delta"):
                 st.session_state["r0_input"] = 6.0
-                st.rerun()
         with col_c:
             if st.button("Omicron (10)", key="preset_omicron"):
                 st.session_state["r0_input"] = 10.0
-                st.rerun()
         
         r0 = st.slider(
             "Nilai R0",
@@ -198,23 +235,8 @@ def _show_r0_calculator():
                 help="Persentase populasi yang perlu kebal"
             )
         
-        # Visualization
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number+delta",
-            value=herd_threshold,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Herd Immunity Threshold (%)"},
-            gauge={
-                'axis': {'range': [0, 100]},
-                'bar': {'color': "rgba(124, 58, 237, 0.8)"},
-                'steps': [
-                    {'range': [0, 50], 'color': "rgba(34, 197, 94, 0.3)"},
-                    {'range': [50, 80], 'color': "rgba(234, 179, 8, 0.3)"},
-                    {'range': [80, 100], 'color': "rgba(220, 38, 38, 0.3)"},
-                ],
-            },
-        ))
-        fig.update_layout(height=300, margin=dict(l=0, r=0, t=40, b=0))
+        # Visualization (cache per nilai yang dibulatkan)
+        fig = go.Figure(_herd_gauge(round(herd_threshold, 2)))
         st.plotly_chart(fig, **ui.kw_plotly_chart())
     
     st.divider()
@@ -232,6 +254,7 @@ def _show_r0_calculator():
         st.error(f"Dengan R0 = {r0:.1f}, herd immunity membutuhkan ~{herd_threshold:.0f}% populasi kebal. Ini sangat sulit dicapai.")
 
 
+@ui.fragment
 def _show_projection_calculator():
     """Tampilkan proyeksi kasus sederhana."""
     
@@ -281,13 +304,13 @@ def _show_projection_calculator():
         st.markdown("### Hasil Proyeksi")
         
         # Calculate projection
-        import numpy as np
-        
+        g = growth_rate / 100
         t = np.arange(days + 1)
-        cases = initial_cases * ((1 + growth_rate / 100) ** t)
+        cases = initial_cases * ((1 + g) ** t)
         
         final_cases = cases[-1]
-        total_new = sum(cases)
+        # Deret geometri (closed form): sum_{t=0..days} initial * (1+g)^t
+        total_new = initial_cases * ((1 + g) ** (days + 1) - 1) / g if g else initial_cases * (days + 1)
         
         st.metric(
             label=f"Kasus/Hari (Hari ke-{days})",
@@ -301,7 +324,7 @@ def _show_projection_calculator():
         
         # Doubling time
         if growth_rate > 0:
-            doubling = np.log(2) / np.log(1 + growth_rate / 100)
+            doubling = np.log(2) / np.log1p(g)
             st.metric(
                 label="Waktu Penggandaan",
                 value=f"{doubling:.1f} hari",
@@ -312,18 +335,11 @@ def _show_projection_calculator():
     # Chart
     st.markdown("### Grafik Proyeksi")
     
-    import pandas as pd
-    
-    df_proj = pd.DataFrame({
-        "Hari": t,
-        "Kasus": cases,
-    })
-    
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
-        x=df_proj["Hari"],
-        y=df_proj["Kasus"],
+        x=t,
+        y=cases,
         mode="lines+markers",
         name="Proyeksi Kasus",
         line=dict(color="rgba(124, 58, 237, 0.8)", width=2),
@@ -16,6 +16,93 @@ import utils
 import ui
 
 
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _hist_fig(df: pd.DataFrame) -> dict:
+    """Histogram distribusi kasus baru harian (sebagai dict)."""
+    fig_hist = px.histogram(
+        df,
+        x="Kasus_Baru",
+        nbins=50,
+        title="Distribusi Kasus Baru Harian",
+        labels={"Kasus_Baru": "Kasus Baru", "count": "Frekuensi"},
+        color_discrete_sequence=["rgba(124, 58, 237, 0.7)"],
+    )
+    fig_hist.update_layout(margin=dict(l=0, r=0, t=40, b=0))
+    return fig_hist.to_dict()
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _box_fig(df: pd.DataFrame) -> dict:
+    """Box plot kasus baru harian (sebagai dict)."""
+    fig_box = go.Figure()
+    fig_box.add_trace(go.Box(
+        y=df["Kasus_Baru"].to_numpy(),
+        name="Kasus Baru",
+        marker_color="rgba(124, 58, 237, 0.7)",
+    ))
+    fig_box.update_layout(
+        title="Box Plot Kasus Baru Harian",
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    return fig_box.to_dict()
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _descriptive_stats(df: pd.DataFrame, column: str) -> dict:
+    """Statistik deskriptif kolom (cache per dataset)."""
+    return utils.calculate_statistics(df, column)
+
+
+# Jumlah titik maksimum trace mentah pada chart rolling (LTTB)
+_RAW_TRACE_POINTS = 1500
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _raw_trace(df: pd.DataFrame, n_out: int = _RAW_TRACE_POINTS) -> tuple:
+    """Trace kasus baru mentah, di-downsample (LTTB) bila terlalu panjang."""
+    tanggal = df["Tanggal"].to_numpy()
+    kasus_baru = df["Kasus_Baru"].to_numpy()
+    idx = utils.lttb_indices(tanggal, kasus_baru, n_out)
+    return tanggal[idx], kasus_baru[idx]
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _rolling_fig(df: pd.DataFrame, window: int) -> dict:
+    """Kasus baru + rata-rata bergerak `window` hari (sebagai dict)."""
+    raw_x, raw_y = _raw_trace(df)
+    rolling = utils.calculate_rolling_average(df, "Kasus_Baru", window, engine="numba")
+    
+    fig_rolling = go.Figure()
+    
+    # Trace mentah di-downsample; rolling tetap resolusi penuh (sudah halus)
+    fig_rolling.add_trace(go.Scatter(
+        x=raw_x,
+        y=raw_y,
+        name="Kasus Baru",
+        mode="lines",
+        line=dict(color="rgba(124, 58, 237, 0.3)", width=1),
+    ))
+    
+    fig_rolling.add_trace(go.Scatter(
+        x=df["Tanggal"].to_numpy(),
+        y=rolling.to_numpy(),
+        name=f"Rata-rata {window} Hari",
+        mode="lines",
+        line=dict(color="rgba(124, 58, 237, 1)", width=2),
+    ))
+    
+    fig_rolling.update_layout(
+        title=f"Kasus Baru dengan Rata-rata {window} Hari",
+        xaxis_title="Tanggal",
+        yaxis_title="Jumlah Kasus",
+        hovermode="x unified",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    
+    return fig_rolling.to_dict()
+
+
 def tampilkan_statistik_data(df: pd.DataFrame, current_stats: dict):
     """Tampilkan halaman statistik data."""
     
@@ -99,7 +186,7 @@ def tampilkan_statistik_data(df: pd.DataFrame, current_stats: dict):
     # --- Statistik Deskriptif ---
     st.subheader("Statistik Deskriptif - Kasus Baru Harian")
     
-    stats = utils.calculate_statistics(df, "Kasus_Baru")
+    stats = _descriptive_stats(df, "Kasus_Baru")
     
     if stats:
         col1, col2, col3, col4 = st.columns(4)
@@ -129,30 +216,11 @@ def tampilkan_statistik_data(df: pd.DataFrame, current_stats: dict):
     
     with col1:
         # Histogram
-        fig_hist = px.histogram(
-            df,
-            x="Kasus_Baru",
-            nbins=50,
-            title="Distribusi Kasus Baru Harian",
-            labels={"Kasus_Baru": "Kasus Baru", "count": "Frekuensi"},
-            color_discrete_sequence=["rgba(124, 58, 237, 0.7)"],
-        )
-        fig_hist.update_layout(margin=dict(l=0, r=0, t=40, b=0))
-        st.plotly_chart(fig_hist, **ui.kw_plotly_chart())
+        st.plotly_chart(go.Figure(_hist_fig(df)), **ui.kw_plotly_chart())
     
     with col2:
         # Box plot
-        fig_box = go.Figure()
-        fig_box.add_trace(go.Box(
-            y=df["Kasus_Baru"],
-            name="Kasus Baru",
-            marker_color="rgba(124, 58, 237, 0.7)",
-        ))
-        fig_box.update_layout(
-            title="Box Plot Kasus Baru Harian",
-            margin=dict(l=0, r=0, t=40, b=0),
-        )
-        st.plotly_chart(fig_box, **ui.kw_plotly_chart())
+        st.plotly_chart(go.Figure(_box_fig(df)), **ui.kw_plotly_chart())
     
     st.divider()
     
@@ -167,34 +235,5 @@ def tampilkan_statistik_data(df: pd.DataFrame, current_stats: dict):
         key="stats_rolling_window"
     )
     
-    df_rolling = df.copy()
-    df_rolling["Rolling"] = utils.calculate_rolling_average(df, "Kasus_Baru", window)
-    
-    fig_rolling = go.Figure()
-    
-    fig_rolling.add_trace(go.Scatter(
-        x=df_rolling["Tanggal"],
-        y=df_rolling["Kasus_Baru"],
-        name="Kasus Baru",
-        mode="lines",
-        line=dict(color="rgba(124, 58, 237, 0.3)", width=1),
-    ))
-    
-    fig_rolling.add_trace(go.Scatter(
-        x=df_rolling["Tanggal"],
-        y=df_rolling["Rolling"],
-        name=f"Rata-rata {window} Hari",
-        mode="lines",
-        line=dict(color="rgba(124, 58, 237, 1)", width=2),
-    ))
-    
-    fig_rolling.update_layout(
-        title=f"Kasus Baru dengan Rata-rata {window} Hari",
-        xaxis_title="Tanggal",
-        yaxis_title="Jumlah Kasus",
-        hovermode="x unified",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        margin=dict(l=0, r=0, t=40, b=0),
-    )
-    
+    fig_rolling = go.Figure(_rolling_fig(df, window))
     st.plotly_chart(fig_rolling, **ui.kw_plotly_chart())
@@ -22,6 +22,92 @@ def _load_vaccine_data():
     return api_client.get_vaccine_df()
 
 
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _cumulative_fig(df: pd.DataFrame) -> dict:
+    """Figure total dosis kumulatif (sebagai dict)."""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=df["Tanggal"].to_numpy(),
+        y=df["Total_Vaksin"].to_numpy(),
+        name="Total Dosis",
+        mode="lines",
+        fill="tozeroy",
+        line=dict(color="rgba(34, 197, 94, 0.8)", width=2),
+        fillcolor="rgba(34, 197, 94, 0.3)",
+    ))
+    
+    fig.update_layout(
+        title="Total Dosis Vaksin Kumulatif",
+        xaxis_title="Tanggal",
+        yaxis_title="Jumlah Dosis",
+        hovermode="x unified",
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    
+    return fig.to_dict()
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _daily_fig(df: pd.DataFrame) -> dict:
+    """Figure dosis harian + rata-rata 7 hari (sebagai dict)."""
+    tanggal = df["Tanggal"].to_numpy()
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=tanggal,
+        y=df["Dosis_Harian"].to_numpy(),
+        name="Dosis Harian",
+        marker_color="rgba(34, 197, 94, 0.6)",
+    ))
+    
+    # Rolling average
+    rolling = df["Dosis_Harian"].rolling(window=7, min_periods=1).mean()
+    fig.add_trace(go.Scatter(
+        x=tanggal,
+        y=rolling.to_numpy(),
+        name="Rata-rata 7 Hari",
+        line=dict(color="rgba(0, 0, 0, 0.8)", width=2),
+    ))
+    
+    fig.update_layout(
+        title="Dosis Vaksin Harian",
+        xaxis_title="Tanggal",
+        yaxis_title="Jumlah Dosis",
+        hovermode="x unified",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        margin=dict(l=0, r=0, t=40, b=0),
+    )
+    
+    return fig.to_dict()
+
+
+# Format kolom ringkasan bulanan (nilai tetap numerik -> bisa di-sort)
+_MONTHLY_COLUMN_CONFIG = {
+    "Total Dosis": st.column_config.NumberColumn("Total Dosis", format="%d"),
+    "Rata-rata/Hari": st.column_config.NumberColumn("Rata-rata/Hari", format="%.1f"),
+    "Maks/Hari": st.column_config.NumberColumn("Maks/Hari", format="%d"),
+}
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _monthly_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """Ringkasan dosis per bulan (12 bulan terakhir)."""
+    monthly_summary = (
+        df.resample("MS", on="Tanggal")["Dosis_Harian"]
+        .agg(["sum", "mean", "max"])
+        .tail(12)
+    )
+    monthly_summary.columns = ["Total Dosis", "Rata-rata/Hari", "Maks/Hari"]
+    
+    # Label bulan dari DatetimeIndex (tanpa kolom Period per baris)
+    bulan = monthly_summary.index
+    monthly_summary.insert(0, "Bulan", bulan.month.map(utils.BULAN_ID) + " " + bulan.year.astype(str))
+    
+    return monthly_summary.reset_index(drop=True)
+
+
 def tampilkan_trend_vaksinasi():
     """Tampilkan halaman trend vaksinasi."""
     
@@ -97,57 +183,11 @@ def tampilkan_trend_vaksinasi():
     )
     
     if tab_selected == "Kumulatif":
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df["Tanggal"],
-            y=df["Total_Vaksin"],
-            name="Total Dosis",
-            mode="lines",
-            fill="tozeroy",
-            line=dict(color="rgba(34, 197, 94, 0.8)", width=2),
-            fillcolor="rgba(34, 197, 94, 0.3)",
-        ))
-        
-        fig.update_layout(
-            title="Total Dosis Vaksin Kumulatif",
-            xaxis_title="Tanggal",
-            yaxis_title="Jumlah Dosis",
-            hovermode="x unified",
-            margin=dict(l=0, r=0, t=40, b=0),
-        )
-        
-        st.plotly_chart(fig, **ui.kw_plotly_chart())
-    
+        fig = go.Figure(_cumulative_fig(df))
     else:  # Harian
-        fig = go.Figure()
-        
-        fig.add_trace(go.Bar(
-            x=df["Tanggal"],
-            y=df["Dosis_Harian"],
-            name="Dosis Harian",
-            marker_color="rgba(34, 197, 94, 0.6)",
-        ))
-        
-        # Rolling average
-        rolling = df["Dosis_Harian"].rolling(window=7, min_periods=1).mean()
-        fig.add_trace(go.Scatter(
-            x=df["Tanggal"],
-            y=rolling,
-            name="Rata-rata 7 Hari",
-            line=dict(color="rgba(0, 0, 0, 0.8)", width=2),
-        ))
-        
-        fig.update_layout(
-            title="Dosis Vaksin Harian",
-            xaxis_title="Tanggal",
-            yaxis_title="Jumlah Dosis",
-            hovermode="x unified",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            margin=dict(l=0, r=0, t=40, b=0),
-        )
-        
-        st.plotly_chart(fig, **ui.kw_plotly_chart())
+        fig = go.Figure(_daily_fig(df))
+    
+    st.plotly_chart(fig, **ui.kw_plotly_chart())
     
     st.divider()
     
@@ -181,19 +221,11 @@ def tampilkan_trend_vaksinasi():
     # --- Monthly Summary ---
     st.subheader("Ringkasan Bulanan")
     
-    df_monthly = df.copy()
-    df_monthly["Bulan"] = df_monthly["Tanggal"].dt.to_period("M")
-    monthly_summary = df_monthly.groupby("Bulan").agg({
-        "Dosis_Harian": ["sum", "mean", "max"]
-    }).reset_index()
-    monthly_summary.columns = ["Bulan", "Total Dosis", "Rata-rata/Hari", "Maks/Hari"]
-    monthly_summary["Bulan"] = monthly_summary["Bulan"].astype(str)
+    monthly_summary = _monthly_summary(df)
     
-    # Show last 12 months
-    monthly_summary = monthly_summary.tail(12)
-    
-    # Format numbers
-    for col in ["Total Dosis", "Rata-rata/Hari", "Maks/Hari"]:
-        monthly_summary[col] = monthly_summary[col].apply(lambda x: utils.format_number(x))
-    
-    st.dataframe(monthly_summary, use_container_width=True, hide_index=True)
+    st.dataframe(
+        monthly_summary,
+        column_config=_MONTHLY_COLUMN_CONFIG,
+        use_container_width=True,
+        hide_index=True,
+    )
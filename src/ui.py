@@ -9,16 +9,38 @@ Tujuan:
 from __future__ import annotations
 
 from typing import Any, Callable, Iterable, Optional
+import datetime
+import functools
 import inspect
 import json
 import base64
-import zlib
 
 import streamlit as st
 
-
-def get_streamlit_theme_base(*, default: str = "light") -> str:
-    """Best-effort read Streamlit's configured theme base."""
+# Opsional: orjson untuk serialisasi URL state (fallback ke json stdlib)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Opsional: isal (DEFLATE ISA-L, stream tetap format zlib) untuk token URL state
+try:
+    from isal import isal_zlib as _zlib
+    _ZLIB_LEVEL = _zlib.ISAL_BEST_COMPRESSION  # level isal: 0-3
+except ImportError:
+    import zlib as _zlib
+    _ZLIB_LEVEL = 6  # level 9 hampir tidak lebih kecil untuk payload sekecil ini
+
+# Opsional: zstd untuk token URL state (fallback ke zlib jika tidak terpasang)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+@functools.lru_cache(maxsize=1)
+def _read_theme_base() -> str | None:
+    """Baca theme.base dari config Streamlit (statis selama proses berjalan)."""
     try:
         from streamlit import config
         base = config.get_option("theme.base")
@@ -26,7 +48,20 @@ def get_streamlit_theme_base(*, default: str = "light") -> str:
             return str(base).lower()
     except Exception:
         pass
-    return default
+    return None
+
+
+def get_streamlit_theme_base(*, default: str = "light") -> str:
+    """Best-effort read Streamlit's configured theme base."""
+    return _read_theme_base() or default
+
+
+def fragment(fn: Callable[..., object]) -> Callable[..., object]:
+    """Decorator st.fragment yang version-tolerant (no-op di Streamlit lama)."""
+    deco = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if deco is None:
+        return fn
+    return deco(fn)
 
 
 def kw_plotly_chart() -> dict:
@@ -34,27 +69,28 @@ def kw_plotly_chart() -> dict:
     return kw_full_width(st.plotly_chart)
 
 
-def kw_full_width(fn: Callable[..., object]) -> dict:
-    """Return kwargs for 'full width' rendering across Streamlit versions."""
+@functools.lru_cache(maxsize=64)
+def _accepts_kwarg(fn: Callable[..., object], name: str) -> bool:
+    """Cek (sekali per fungsi) apakah fn menerima kwarg `name`."""
     try:
-        sig = inspect.signature(fn)
-        if "width" in sig.parameters:
-            return {"width": "stretch"}
-        return {"use_container_width": True}
+        return name in inspect.signature(fn).parameters
     except Exception:
-        return {"use_container_width": True}
+        return False
+
+
+def kw_full_width(fn: Callable[..., object]) -> dict:
+    """Return kwargs for 'full width' rendering across Streamlit versions."""
+    if _accepts_kwarg(fn, "width"):
+        return {"width": "stretch"}
+    return {"use_container_width": True}
 
 
 def _kw_button_type(fn: Callable[..., object], btn_type: str | None) -> dict:
     """Return kwargs for button type across Streamlit versions."""
     if btn_type is None:
         return {}
-    try:
-        sig = inspect.signature(fn)
-        if "type" in sig.parameters:
-            return {"type": btn_type}
-    except Exception:
-        pass
+    if _accepts_kwarg(fn, "type"):
+        return {"type": btn_type}
     return {}
 
 
@@ -117,9 +153,22 @@ def request_navigation(page_label: str, *, key: str = "app_page") -> None:
     st.session_state[f"_{key}_pending"] = page_label
 
 
+# Jalur cepat _json_default: dispatch berdasarkan tipe persis
+_JSON_HANDLERS: dict[type, Callable[[Any], Any]] = {
+    datetime.date: datetime.date.isoformat,
+    datetime.datetime: datetime.datetime.isoformat,
+    set: list,
+    frozenset: list,
+    tuple: list,
+}
+
+
 def _json_default(obj: object) -> Any:
     """Best-effort JSON serializer for common UI state types."""
-    import datetime
+    handler = _JSON_HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    # Subclass (mis. pd.Timestamp) & iterable lain
     if isinstance(obj, datetime.date):
         return obj.isoformat()
     if hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes)):
@@ -211,12 +260,31 @@ def section_nav(
     return selected if selected else current
 
 
+# Prefix 1 byte untuk token JSON mentah / zstd. Token zlib tidak ber-prefix
+# (byte pertama stream zlib selalu 0x?8, mis. 0x78), jadi token lama tetap bisa dibaca.
+_URL_CODEC_RAW = b"\x00"
+_URL_CODEC_ZSTD = b"\x01"
+
+
 def _encode_url_state(payload: dict) -> str:
     """Encode dict -> compact URL-safe string."""
     try:
-        json_bytes = json.dumps(payload, separators=(",", ":"), default=_json_default).encode()
-        compressed = zlib.compress(json_bytes, level=9)
-        return base64.urlsafe_b64encode(compressed).decode().rstrip("=")
+        if orjson is not None:
+            json_bytes = orjson.dumps(
+                payload,
+                default=_json_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+        else:
+            json_bytes = json.dumps(payload, separators=(",", ":"), default=_json_default).encode()
+        if zstandard is not None:
+            compressed = _URL_CODEC_ZSTD + zstandard.ZstdCompressor(level=19).compress(json_bytes)
+        else:
+            compressed = _zlib.compress(json_bytes, _ZLIB_LEVEL)
+        # Payload kecil: header kompresi bisa membuat token lebih panjang dari JSON mentah
+        raw = _URL_CODEC_RAW + json_bytes
+        encoded = raw if len(raw) <= len(compressed) else compressed
+        return base64.urlsafe_b64encode(encoded).decode().rstrip("=")
     except Exception:
         return ""
 
@@ -224,22 +292,41 @@ def _encode_url_state(payload: dict) -> str:
 def _decode_url_state(token: str) -> dict:
     """Decode URL state token."""
     try:
-        padding = 4 - len(token) % 4
-        if padding != 4:
-            token += "=" * padding
-        compressed = base64.urlsafe_b64decode(token)
-        json_bytes = zlib.decompress(compressed)
+        # Token tanpa padding "=": tambahkan langsung di bytes
+        pad = b"=" * (-len(token) % 4)
+        compressed = base64.urlsafe_b64decode(token.encode() + pad)
+        if compressed[:1] == _URL_CODEC_RAW:
+            json_bytes = compressed[1:]
+        elif compressed[:1] == _URL_CODEC_ZSTD:
+            if zstandard is None:
+                return {}
+            json_bytes = zstandard.ZstdDecompressor().decompress(compressed[1:])
+        else:
+            json_bytes = _zlib.decompress(compressed)
         return json.loads(json_bytes)
     except Exception:
         return {}
 
 
+# API query params di-resolve sekali saat import (st.query_params: Streamlit >= 1.30)
+if hasattr(st, "query_params"):
+    def _read_query_params() -> dict:
+        return dict(st.query_params)
+    
+    def _write_query_params(params: dict) -> None:
+        st.query_params.update(params)
+else:
+    def _read_query_params() -> dict:
+        return st.experimental_get_query_params()
+    
+    def _write_query_params(params: dict) -> None:
+        st.experimental_set_query_params(**params)
+
+
 def _get_query_params() -> dict:
     """Get query params in a version-tolerant way."""
     try:
-        if hasattr(st, "query_params"):
-            return dict(st.query_params)
-        return st.experimental_get_query_params()
+        return _read_query_params()
     except Exception:
         return {}
 
@@ -247,10 +334,7 @@ def _get_query_params() -> dict:
 def _set_query_params(params: dict) -> None:
     """Set query params in a version-tolerant way."""
     try:
-        if hasattr(st, "query_params"):
-            st.query_params.update(params)
-        else:
-            st.experimental_set_query_params(**params)
+        _write_query_params(params)
     except Exception:
         pass
 
@@ -265,7 +349,8 @@ def sync_state_from_url(
     """Hydrate session_state from URL query param once per session."""
     
     sentinel = f"_url_synced_{namespace}"
-    if st.session_state.get(sentinel):
+    # Sentinel hanya pernah di-set True: cukup satu cek keanggotaan per rerun
+    if sentinel in st.session_state:
         return
     
     st.session_state[sentinel] = True
@@ -304,7 +389,6 @@ def build_share_query(
 
 def coerce_iso_date(value: object):
     """Coerce 'YYYY-MM-DD' string -> datetime.date."""
-    import datetime
     if isinstance(value, datetime.date):
         return value
     if isinstance(value, str):
@@ -372,16 +456,19 @@ def persisted_multiselect(
     
     current = st.session_state.get(key)
     
+    # Validasi via set: O(N+M) alih-alih list.__contains__ O(N*M)
+    opt_set = set(options)
+    
     if isinstance(current, list):
-        valid = [v for v in current if v in options]
+        valid = [v for v in current if v in opt_set]
         if valid:
             default_val = valid
         elif default:
-            default_val = [d for d in default if d in options]
+            default_val = [d for d in default if d in opt_set]
         else:
             default_val = []
     elif default:
-        default_val = [d for d in default if d in options]
+        default_val = [d for d in default if d in opt_set]
     else:
         default_val = []
     
@@ -8,12 +8,32 @@ Tujuan file ini:
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+
 import pandas as pd
 import numpy as np
 from typing import Optional
 from datetime import datetime, timedelta
 
+try:  # Opsional: moving window di C (satu loop atas buffer NumPy)
+    import bottleneck as bn
+except ImportError:  # pragma: no cover
+    bn = None
+
+
+# Opsional: numba untuk engine rolling pandas (cek tanpa meng-import numba)
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+# Di bawah ukuran ini overhead JIT numba lebih besar dari keuntungannya
+_NUMBA_MIN_ROWS = 50_000
+
 
+# Pemisah gaya Indonesia: ribuan "." dan desimal "," (satu pass translate)
+_ID_NUMBER_TABLE = str.maketrans({",": ".", ".": ","})
+
+
+@functools.lru_cache(maxsize=1024)
 def format_number(num: int | float, decimals: int = 0) -> str:
     """
     Format angka dengan pemisah ribuan.
@@ -29,8 +49,28 @@ def format_number(num: int | float, decimals: int = 0) -> str:
         return "-"
     
     if decimals > 0:
-        return f"{num:,.{decimals}f}".replace(",", ".")
-    return f"{int(num):,}".replace(",", ".")
+        return f"{num:,.{decimals}f}".translate(_ID_NUMBER_TABLE)
+    return f"{int(num):,}".translate(_ID_NUMBER_TABLE)
+
+
+def format_number_series(series: pd.Series) -> pd.Series:
+    """
+    Versi per kolom dari format_number (tanpa desimal).
+    
+    Args:
+        series: Series numerik
+        
+    Returns:
+        Series string terformat, nilai kosong menjadi "-"
+    """
+    valid = series.notna()
+    formatted = (
+        series.where(valid, 0)
+        .astype("int64")
+        .map("{:,}".format)
+        .str.replace(",", ".", regex=False)
+    )
+    return formatted.where(valid, "-")
 
 
 def format_percentage(num: float, decimals: int = 2) -> str:
@@ -40,6 +80,7 @@ def format_percentage(num: float, decimals: int = 2) -> str:
     return f"{num:.{decimals}f}%"
 
 
+@functools.lru_cache(maxsize=1024)
 def calculate_cfr(deaths: int, cases: int) -> float:
     """
     Hitung Case Fatality Rate (CFR).
@@ -80,7 +121,12 @@ def calculate_active_rate(active: int, cases: int) -> float:
     return (active / cases) * 100
 
 
-def calculate_rolling_average(df: pd.DataFrame, column: str, window: int = 7) -> pd.Series:
+def calculate_rolling_average(
+    df: pd.DataFrame,
+    column: str,
+    window: int = 7,
+    engine: Optional[str] = None,
+) -> pd.Series:
     """
     Hitung rolling average.
     
@@ -88,11 +134,84 @@ def calculate_rolling_average(df: pd.DataFrame, column: str, window: int = 7) ->
         df: DataFrame dengan data
         column: Nama kolom
         window: Ukuran window (default 7 hari)
+        engine: "numba" untuk JIT pandas (hanya dipakai bila numba terpasang
+            dan data cukup besar); selain itu bottleneck (bila terpasang)
+            atau langsung dengan NumPy
         
     Returns:
         Series dengan rolling average
     """
-    return df[column].rolling(window=window, min_periods=1).mean()
+    series = df[column]
+    if engine == "numba" and _HAS_NUMBA and len(df) >= _NUMBA_MIN_ROWS:
+        return series.rolling(window=window, min_periods=1).mean(engine="numba")
+    
+    values = series.to_numpy(dtype="float64")
+    if bn is not None:
+        # min_count=1 setara min_periods=1 (NaN dilewati per window)
+        rolling = bn.move_mean(values, window=window, min_count=1)
+        return pd.Series(rolling, index=series.index, name=column)
+    
+    if np.isnan(values).any():
+        # NaN: biarkan pandas yang menangani (skip NaN per window)
+        return series.rolling(window=window, min_periods=1).mean()
+    
+    return pd.Series(_rolling_mean(values, window), index=series.index, name=column)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean via cumsum (semantik min_periods=1: window awal lebih pendek)."""
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    n = len(values)
+    end = np.arange(1, n + 1)
+    start = np.maximum(end - window, 0)
+    return (csum[end] - csum[start]) / (end - start)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int = 1500) -> np.ndarray:
+    """
+    Pilih indeks titik dengan Largest-Triangle-Three-Buckets (LTTB).
+    
+    Downsampling untuk chart: bentuk visual (puncak/lembah) tetap terjaga
+    walau jumlah titik dikurangi.
+    
+    Args:
+        x: Nilai sumbu-x (numerik/datetime64, terurut naik)
+        y: Nilai sumbu-y
+        n_out: Jumlah titik output maksimum
+        
+    Returns:
+        Array indeks terurut (semua indeks jika len(x) <= n_out)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x).astype("float64")
+    y = np.asarray(y, dtype="float64")
+    
+    # Titik pertama & terakhir selalu dipakai; sisanya dibagi n_out - 2 bucket
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Rata-rata bucket berikutnya (atau titik terakhir)
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:nxt_end].mean()
+        avg_y = y[end:nxt_end].mean()
+        
+        # Luas segitiga (a, kandidat, rata-rata bucket berikutnya)
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        out[i + 1] = a
+    
+    return out
 
 
 def calculate_r0_estimate(df: pd.DataFrame, generation_time: int = 5) -> float:
@@ -112,10 +231,10 @@ def calculate_r0_estimate(df: pd.DataFrame, generation_time: int = 5) -> float:
     if len(df) < generation_time * 2:
         return 1.0
     
-    recent = df.tail(generation_time * 2)
+    kasus_baru = df["Kasus_Baru"].to_numpy(dtype="float64")
     
-    current_avg = recent.tail(generation_time)["Kasus_Baru"].mean()
-    previous_avg = recent.head(generation_time)["Kasus_Baru"].mean()
+    current_avg = kasus_baru[-generation_time:].mean()
+    previous_avg = kasus_baru[-2 * generation_time:-generation_time].mean()
     
     if previous_avg <= 0:
         return 1.0
@@ -139,22 +258,23 @@ def calculate_doubling_time(df: pd.DataFrame) -> Optional[float]:
     if len(df) < 14:
         return None
     
-    recent = df.tail(14)
-    
-    start_cases = recent.iloc[0]["Kasus"]
-    end_cases = recent.iloc[-1]["Kasus"]
+    kasus = df["Kasus"].to_numpy(dtype="float64")[-14:]
+    days = np.arange(14)
     
-    if start_cases <= 0 or end_cases <= start_cases:
+    # Fit log-linear atas 14 hari terakhir (lebih tahan noise dari 2 titik ujung)
+    valid = kasus > 0
+    if valid.sum() < 2:
         return None
     
-    growth_rate = (end_cases / start_cases) ** (1 / 14) - 1
+    slope = np.polyfit(days[valid], np.log(kasus[valid]), 1)[0]
     
-    if growth_rate <= 0:
+    if slope <= 0:
         return None
     
-    return np.log(2) / np.log(1 + growth_rate)
+    return np.log(2) / slope
 
 
+@functools.lru_cache(maxsize=1024)
 def calculate_herd_immunity_threshold(r0: float) -> float:
     """
     Hitung threshold herd immunity.
@@ -187,10 +307,10 @@ def get_trend_direction(df: pd.DataFrame, column: str, days: int = 7) -> str:
     if len(df) < days * 2:
         return "stabil"
     
-    recent = df.tail(days * 2)
+    values = df[column].to_numpy(dtype="float64")
     
-    first_half = recent.head(days)[column].mean()
-    second_half = recent.tail(days)[column].mean()
+    first_half = values[-2 * days:-days].mean()
+    second_half = values[-days:].mean()
     
     if first_half == 0:
         return "stabil"
@@ -235,15 +355,29 @@ def filter_by_date_range(
     if df.empty:
         return df
     
-    result = df.copy()
+    dates = df[date_column]
+    values = dates.to_numpy()
+    
+    # Data time-series terurut: batas via binary search, hasil berupa irisan
+    if dates.is_monotonic_increasing:
+        lo = 0 if start_date is None else np.searchsorted(
+            values, pd.Timestamp(start_date).to_datetime64(), side="left"
+        )
+        hi = len(values) if end_date is None else np.searchsorted(
+            values, pd.Timestamp(end_date).to_datetime64(), side="right"
+        )
+        return df.iloc[lo:hi]
+    
+    # Tidak terurut: satu mask gabungan, tanpa copy di awal
+    mask = np.ones(len(df), dtype=bool)
     
     if start_date is not None:
-        result = result[result[date_column] >= pd.Timestamp(start_date)]
+        mask &= values >= pd.Timestamp(start_date).to_datetime64()
     
     if end_date is not None:
-        result = result[result[date_column] <= pd.Timestamp(end_date)]
+        mask &= values <= pd.Timestamp(end_date).to_datetime64()
     
-    return result
+    return df.iloc[mask]
 
 
 def calculate_statistics(df: pd.DataFrame, column: str) -> dict:
@@ -260,21 +394,29 @@ def calculate_statistics(df: pd.DataFrame, column: str) -> dict:
     if df.empty or column not in df.columns:
         return {}
     
-    series = df[column].dropna()
+    series = df[column]
+    if series.hasnans:
+        series = series.dropna()
     
-    if len(series) == 0:
+    values = series.to_numpy()
+    n = len(values)
+    
+    if n == 0:
         return {}
     
+    # Kuartil sekaligus (interpolasi linear, sama dengan Series.quantile)
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    
     return {
-        "count": len(series),
-        "mean": series.mean(),
-        "std": series.std(),
-        "min": series.min(),
-        "max": series.max(),
-        "median": series.median(),
-        "q1": series.quantile(0.25),
-        "q3": series.quantile(0.75),
-        "sum": series.sum(),
+        "count": n,
+        "mean": values.mean(),
+        "std": values.std(ddof=1) if n > 1 else np.nan,
+        "min": values.min(),
+        "max": values.max(),
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "sum": values.sum(),
     }
 
 
@@ -316,15 +458,18 @@ def add_date_features(df: pd.DataFrame, date_column: str = "Tanggal") -> pd.Data
     if df.empty or date_column not in df.columns:
         return df
     
-    result = df.copy()
-    result["Tahun"] = result[date_column].dt.year
-    result["Bulan"] = result[date_column].dt.month
-    result["Nama_Bulan"] = result[date_column].dt.strftime("%B")
-    result["Hari"] = result[date_column].dt.day
-    result["Minggu"] = result[date_column].dt.isocalendar().week
-    result["Hari_Minggu"] = result[date_column].dt.day_name()
+    dates = df[date_column].dt
+    bulan = dates.month
     
-    return result
+    # Satu assign; nama bulan/hari via mapping (bukan strftime per baris)
+    return df.assign(
+        Tahun=dates.year,
+        Bulan=bulan,
+        Nama_Bulan=bulan.map(BULAN_ID),
+        Hari=dates.day,
+        Minggu=dates.isocalendar().week,
+        Hari_Minggu=dates.dayofweek.map(HARI_ID),
+    )
 
 
 # Mapping nama bulan Indonesia
@@ -344,6 +489,18 @@ BULAN_ID = {
 }
 
 
+# Mapping nama hari Indonesia (dayofweek: Senin = 0)
+HARI_ID = {
+    0: "Senin",
+    1: "Selasa",
+    2: "Rabu",
+    3: "Kamis",
+    4: "Jumat",
+    5: "Sabtu",
+    6: "Minggu",
+}
+
+
 def get_bulan_indonesia(month: int) -> str:
     """Get nama bulan dalam Bahasa Indonesia."""
     return BULAN_ID.get(month, str(month))
@@ -33,8 +33,9 @@ def tampilkan_visualisasi_covid(df: pd.DataFrame):
     
     col1, col2 = st.columns(2)
     
-    min_date = df["Tanggal"].min().date()
-    max_date = df["Tanggal"].max().date()
+    tanggal = df["Tanggal"]
+    min_date = tanggal.min().date()
+    max_date = tanggal.max().date()
     
     with col1:
         start_date = st.date_input(
@@ -87,41 +88,30 @@ def tampilkan_visualisasi_covid(df: pd.DataFrame):
         _show_distribution(df_filtered)
 
 
-def _show_cumulative_trend(df: pd.DataFrame):
-    """Tampilkan trend kumulatif."""
-    
-    st.subheader("Trend Kumulatif COVID-19")
-    
-    # Pilih metrik
-    metrics = st.multiselect(
-        "Pilih Metrik",
-        options=["Kasus", "Kematian", "Sembuh"],
-        default=["Kasus", "Kematian"],
-        key="viz_cumulative_metrics"
-    )
-    
-    if not metrics:
-        st.info("Pilih minimal satu metrik untuk ditampilkan.")
-        return
-    
-    fig = go.Figure()
-    
-    colors = {
-        "Kasus": "rgba(124, 58, 237, 0.8)",
-        "Kematian": "rgba(220, 38, 38, 0.8)",
-        "Sembuh": "rgba(34, 197, 94, 0.8)",
-    }
-    
-    for metric in metrics:
-        if metric in df.columns:
-            fig.add_trace(go.Scatter(
-                x=df["Tanggal"],
-                y=df[metric],
-                name=metric,
-                mode="lines",
-                line=dict(color=colors.get(metric, "gray"), width=2),
-                fill="tonexty" if metric == "Sembuh" else None,
-            ))
+_CUMULATIVE_COLORS = {
+    "Kasus": "rgba(124, 58, 237, 0.8)",
+    "Kematian": "rgba(220, 38, 38, 0.8)",
+    "Sembuh": "rgba(34, 197, 94, 0.8)",
+}
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _cumulative_fig(df: pd.DataFrame, metrics: tuple) -> dict:
+    """Figure trend kumulatif untuk metrik terpilih (sebagai dict)."""
+    # Semua trace dibangun sekaligus; sumbu-x dipakai bersama
+    tanggal = df["Tanggal"].to_numpy()
+    fig = go.Figure(data=[
+        go.Scatter(
+            x=tanggal,
+            y=df[metric].to_numpy(),
+            name=metric,
+            mode="lines",
+            line=dict(color=_CUMULATIVE_COLORS.get(metric, "gray"), width=2),
+            fill="tonexty" if metric == "Sembuh" else None,
+        )
+        for metric in metrics
+        if metric in df.columns
+    ])
     
     fig.update_layout(
         title="Trend Kumulatif COVID-19 Indonesia",
@@ -133,42 +123,30 @@ def _show_cumulative_trend(df: pd.DataFrame):
         margin=dict(l=0, r=0, t=40, b=0),
     )
     
-    st.plotly_chart(fig, **ui.kw_plotly_chart())
+    return fig.to_dict()
 
 
-def _show_daily_cases(df: pd.DataFrame):
-    """Tampilkan kasus harian."""
-    
-    st.subheader("Kasus Baru Harian")
-    
-    # Pilih metrik
-    metric = st.radio(
-        "Pilih Metrik",
-        options=["Kasus_Baru", "Kematian_Baru"],
-        format_func=lambda x: "Kasus Baru" if x == "Kasus_Baru" else "Kematian Baru",
-        horizontal=True,
-        key="viz_daily_metric"
-    )
-    
-    # Rolling average toggle
-    show_rolling = st.checkbox("Tampilkan Rata-rata 7 Hari", value=True, key="viz_show_rolling")
-    
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _daily_fig(df: pd.DataFrame, metric: str, show_rolling: bool) -> dict:
+    """Figure kasus/kematian baru harian (+ rata-rata 7 hari) sebagai dict."""
+    # Sumbu-x dipakai bersama oleh bar dan garis rata-rata
+    tanggal = df["Tanggal"].to_numpy()
     fig = go.Figure()
     
     color = "rgba(124, 58, 237, 0.6)" if metric == "Kasus_Baru" else "rgba(220, 38, 38, 0.6)"
     
     fig.add_trace(go.Bar(
-        x=df["Tanggal"],
-        y=df[metric],
+        x=tanggal,
+        y=df[metric].to_numpy(),
         name="Harian",
         marker_color=color,
     ))
     
     if show_rolling:
-        rolling = df[metric].rolling(window=7, min_periods=1).mean()
+        rolling = utils.calculate_rolling_average(df, metric, window=7)
         fig.add_trace(go.Scatter(
-            x=df["Tanggal"],
-            y=rolling,
+            x=tanggal,
+            y=rolling.to_numpy(),
             name="Rata-rata 7 Hari",
             line=dict(color="rgba(0, 0, 0, 0.8)", width=2),
         ))
@@ -185,46 +163,41 @@ def _show_daily_cases(df: pd.DataFrame):
         margin=dict(l=0, r=0, t=40, b=0),
     )
     
-    st.plotly_chart(fig, **ui.kw_plotly_chart())
+    return fig.to_dict()
 
 
-def _show_comparison(df: pd.DataFrame):
-    """Tampilkan perbandingan metrik."""
-    
-    st.subheader("Perbandingan Kasus vs Kematian vs Sembuh")
-    
-    # Normalisasi untuk perbandingan
-    df_norm = df.copy()
-    
-    fig = go.Figure()
-    
-    # Area chart stacked
-    fig.add_trace(go.Scatter(
-        x=df_norm["Tanggal"],
-        y=df_norm["Kematian"],
-        name="Kematian",
-        stackgroup="one",
-        fillcolor="rgba(220, 38, 38, 0.7)",
-        line=dict(width=0),
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=df_norm["Tanggal"],
-        y=df_norm["Sembuh"],
-        name="Sembuh",
-        stackgroup="one",
-        fillcolor="rgba(34, 197, 94, 0.7)",
-        line=dict(width=0),
-    ))
-    
-    # Kasus total sebagai line
-    fig.add_trace(go.Scatter(
-        x=df_norm["Tanggal"],
-        y=df_norm["Kasus"],
-        name="Total Kasus",
-        mode="lines",
-        line=dict(color="rgba(124, 58, 237, 1)", width=2),
-    ))
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _comparison_fig(df: pd.DataFrame) -> dict:
+    """Figure perbandingan kasus, sembuh, dan kematian (sebagai dict)."""
+    tanggal = df["Tanggal"].to_numpy()
+    
+    fig = go.Figure(data=[
+        # Area chart stacked
+        go.Scatter(
+            x=tanggal,
+            y=df["Kematian"].to_numpy(),
+            name="Kematian",
+            stackgroup="one",
+            fillcolor="rgba(220, 38, 38, 0.7)",
+            line=dict(width=0),
+        ),
+        go.Scatter(
+            x=tanggal,
+            y=df["Sembuh"].to_numpy(),
+            name="Sembuh",
+            stackgroup="one",
+            fillcolor="rgba(34, 197, 94, 0.7)",
+            line=dict(width=0),
+        ),
+        # Kasus total sebagai line
+        go.Scatter(
+            x=tanggal,
+            y=df["Kasus"].to_numpy(),
+            name="Total Kasus",
+            mode="lines",
+            line=dict(color="rgba(124, 58, 237, 1)", width=2),
+        ),
+    ])
     
     fig.update_layout(
         title="Perbandingan Jumlah Kasus, Sembuh, dan Kematian",
@@ -236,6 +209,89 @@ def _show_comparison(df: pd.DataFrame):
         margin=dict(l=0, r=0, t=40, b=0),
     )
     
+    return fig.to_dict()
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _distribution_hist_fig(df: pd.DataFrame) -> dict:
+    """Histogram kasus baru harian (sebagai dict)."""
+    fig_hist = px.histogram(
+        df,
+        x="Kasus_Baru",
+        nbins=50,
+        title="Histogram Kasus Baru Harian",
+        labels={"Kasus_Baru": "Kasus Baru", "count": "Frekuensi"},
+        color_discrete_sequence=["rgba(124, 58, 237, 0.7)"],
+    )
+    fig_hist.update_layout(margin=dict(l=0, r=0, t=40, b=0))
+    return fig_hist.to_dict()
+
+
+@st.cache_data(ttl=60 * 60, show_spinner=False)
+def _distribution_box_fig(df: pd.DataFrame) -> dict:
+    """Box plot kasus baru per bulan (sebagai dict)."""
+    df_with_month = utils.add_date_features(df)
+    
+    fig_box = px.box(
+        df_with_month,
+        x="Bulan",
+        y="Kasus_Baru",
+        title="Distribusi Kasus Baru per Bulan",
+        labels={"Kasus_Baru": "Kasus Baru", "Bulan": "Bulan"},
+        color_discrete_sequence=["rgba(124, 58, 237, 0.7)"],
+    )
+    fig_box.update_layout(margin=dict(l=0, r=0, t=40, b=0))
+    return fig_box.to_dict()
+
+
+def _show_cumulative_trend(df: pd.DataFrame):
+    """Tampilkan trend kumulatif."""
+    
+    st.subheader("Trend Kumulatif COVID-19")
+    
+    # Pilih metrik
+    metrics = st.multiselect(
+        "Pilih Metrik",
+        options=["Kasus", "Kematian", "Sembuh"],
+        default=["Kasus", "Kematian"],
+        key="viz_cumulative_metrics"
+    )
+    
+    if not metrics:
+        st.info("Pilih minimal satu metrik untuk ditampilkan.")
+        return
+    
+    fig = go.Figure(_cumulative_fig(df, tuple(metrics)))
+    st.plotly_chart(fig, **ui.kw_plotly_chart())
+
+
+def _show_daily_cases(df: pd.DataFrame):
+    """Tampilkan kasus harian."""
+    
+    st.subheader("Kasus Baru Harian")
+    
+    # Pilih metrik
+    metric = st.radio(
+        "Pilih Metrik",
+        options=["Kasus_Baru", "Kematian_Baru"],
+        format_func=lambda x: "Kasus Baru" if x == "Kasus_Baru" else "Kematian Baru",
+        horizontal=True,
+        key="viz_daily_metric"
+    )
+    
+    # Rolling average toggle
+    show_rolling = st.checkbox("Tampilkan Rata-rata 7 Hari", value=True, key="viz_show_rolling")
+    
+    fig = go.Figure(_daily_fig(df, metric, show_rolling))
+    st.plotly_chart(fig, **ui.kw_plotly_chart())
+
+
+def _show_comparison(df: pd.DataFrame):
+    """Tampilkan perbandingan metrik."""
+    
+    st.subheader("Perbandingan Kasus vs Kematian vs Sembuh")
+    
+    fig = go.Figure(_comparison_fig(df))
     st.plotly_chart(fig, **ui.kw_plotly_chart())
 
 
@@ -248,28 +304,8 @@ def _show_distribution(df: pd.DataFrame):
     
     with col1:
         # Histogram
-        fig_hist = px.histogram(
-            df,
-            x="Kasus_Baru",
-            nbins=50,
-            title="Histogram Kasus Baru Harian",
-            labels={"Kasus_Baru": "Kasus Baru", "count": "Frekuensi"},
-            color_discrete_sequence=["rgba(124, 58, 237, 0.7)"],
-        )
-        fig_hist.update_layout(margin=dict(l=0, r=0, t=40, b=0))
-        st.plotly_chart(fig_hist, **ui.kw_plotly_chart())
+        st.plotly_chart(go.Figure(_distribution_hist_fig(df)), **ui.kw_plotly_chart())
     
     with col2:
         # Box plot per bulan
-        df_with_month = utils.add_date_features(df)
-        
-        fig_box = px.box(
-            df_with_month,
-            x="Bulan",
-            y="Kasus_Baru",
-            title="Distribusi Kasus Baru per Bulan",
-            labels={"Kasus_Baru": "Kasus Baru", "Bulan": "Bulan"},
-            color_discrete_sequence=["rgba(124, 58, 237, 0.7)"],
-        )
-        fig_box.update_layout(margin=dict(l=0, r=0, t=40, b=0))
-        st.plotly_chart(fig_box, **ui.kw_plotly_chart())
+        st.plotly_chart(go.Figure(_distribution_box_fig(df)), **ui.kw_plotly_chart())